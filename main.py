@@ -23,6 +23,9 @@ class MLPipeline:
         self.loader: DataLoader = DataLoader()
         self.trainer: ModelTrainer = ModelTrainer()
         self.evaluator: ModelEvaluator = ModelEvaluator()
+        # In-memory handoff of the merged record between preprocess and train,
+        # sparing the training phase a full Parquet read-back
+        self._merged_table = None
 
     def _speak(self, message: str) -> None:
         """Helper to provide audio feedback on macOS."""
@@ -56,7 +59,7 @@ class MLPipeline:
 
         # Step 4: Final Feature/Target set creation
         print("\n▶ STEP 4: Merge Datasets")
-        self.processor.merge_faulty_and_normal_data()
+        self._merged_table = self.processor.merge_faulty_and_normal_data()
 
         print("\n✅ PREPROCESSING COMPLETED")
         self._speak("Preprocessing finished")
@@ -79,9 +82,12 @@ class MLPipeline:
         print("🧠 STARTING DATA PREPARATION & TRAINING")
         print("="*70)
 
-        # Step 1: Loading from processed Parquet storage (IO efficient)
+        # Step 1: Loading from processed Parquet storage (IO efficient).
+        # A same-process preprocess phase hands over the merged Arrow table
+        # directly; otherwise the loader falls back to the Parquet artifact.
         print("\n▶ STEP 1: Loading Data (with cache check)")
-        df: pd.DataFrame = self.loader.load_data()
+        df: pd.DataFrame = self.loader.load_data(prebuilt=self._merged_table)
+        self._merged_table = None
 
         # Step 2: MLOps Guardrail - Splitting by 'Run' ID to ensure validation robustness
         print("▶ STEP 2: Splitting Data by Run (Avoid Leakage)")
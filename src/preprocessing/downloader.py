@@ -1,7 +1,9 @@
+import os
 import shutil
-import kagglehub
+import zipfile
 import yaml
 from pathlib import Path
+from src.preprocessing.parallel_download import range_download
 from src.config import (
     RAW_DATA_PATH,
     RAW_CSV_FILES,
@@ -60,6 +62,20 @@ class DataDownloader:
 
         print(f"🚀 Initiating secure ingestion for dataset: {self.dataset_name}")
 
+        # Fast path: a direct artifact URL (mirror/CDN) enables multi-stream
+        # range-GET transfers that a single kagglehub TCP stream cannot match
+        direct_url: str | None = os.getenv("TEP_DATASET_URL")
+        if direct_url:
+            return self._download_from_url(direct_url)
+
+        # Deferred import: kagglehub costs hundreds of ms to load, so CLIs
+        # that never reach the network ingestion path never pay for it
+        import kagglehub
+
+        # Widen kagglehub's HTTP read buffer to 1 MiB: the historical 8 KiB
+        # default costs ~65k Python<->C round-trips on a 500MB transfer
+        self._tune_download_buffer()
+
         # Fetch remote artifacts (KaggleHub abstracts local caching and versioning)
         temp_download_path: str = kagglehub.dataset_download(self.dataset_name)
         print(f"📦 Upstream artifact cached at: {temp_download_path}")
@@ -67,8 +83,16 @@ class DataDownloader:
         # Ensure destination hierarchy exists before state synchronization
         RAW_DATA_PATH.parent.mkdir(parents=True, exist_ok=True)
 
-        # Synchronize data: Restores missing files and enforces target state consistency
-        shutil.copytree(temp_download_path, RAW_DATA_PATH, dirs_exist_ok=True)
+        # Zero-copy synchronization: expose the KaggleHub cache via symlink
+        # instead of duplicating ~500MB of artifacts into the Bronze Layer
+        try:
+            if RAW_DATA_PATH.is_symlink():
+                RAW_DATA_PATH.unlink()
+            RAW_DATA_PATH.symlink_to(Path(temp_download_path), target_is_directory=True)
+            print("🔗 Bronze Layer linked to upstream cache (zero-copy)")
+        except OSError:
+            # Fallback for filesystems without symlink support (e.g. Windows without dev mode)
+            shutil.copytree(temp_download_path, RAW_DATA_PATH, dirs_exist_ok=True)
 
         # Persist ingestion metadata for lifecycle audit and traceability
         self._save_cache_info(temp_download_path)
@@ -76,6 +100,57 @@ class DataDownloader:
         print("✅ Ingestion cycle completed successfully")
         return str(RAW_DATA_PATH)
 
+    @staticmethod
+    def _tune_download_buffer(chunk_size: int = 1 << 20) -> None:
+        """Raises kagglehub's streaming chunk size to cut syscall overhead.
+
+        Guarded by hasattr so a kagglehub release that renames or removes the
+        constant degrades to its own default instead of breaking ingestion.
+
+        Args:
+            chunk_size (int): Target read-buffer size in bytes. Defaults to 1 MiB.
+
+        Returns:
+            None
+        """
+        try:
+            from kagglehub import clients as kagglehub_clients
+        except ImportError:
+            return
+
+        if hasattr(kagglehub_clients, "CHUNK_SIZE"):
+            if kagglehub_clients.CHUNK_SIZE < chunk_size:
+                kagglehub_clients.CHUNK_SIZE = chunk_size
+                print(f"⚙️ Download buffer raised to {chunk_size >> 10} KiB")
+
+    def _download_from_url(self, url: str) -> str:
+        """Ingests the dataset archive from a direct URL via parallel range-GETs.
+
+        Args:
+            url (str): Direct URL to the dataset zip archive (TEP_DATASET_URL).
+
+        Returns:
+            str: The resolved string representation of the local data path.
+
+        Raises:
+            requests.HTTPError: If the remote transfer fails.
+            zipfile.BadZipFile: If the downloaded archive is corrupted.
+        """
+        archive_path: Path = RAW_DATA_PATH.parent / "tep-csv.zip"
+        range_download(url, archive_path)
+
+        print(f"📦 Extracting archive into: {RAW_DATA_PATH}")
+        RAW_DATA_PATH.mkdir(parents=True, exist_ok=True)
+        with zipfile.ZipFile(archive_path) as zf:
+            zf.extractall(RAW_DATA_PATH)
+
+        # Archive no longer needed once the Bronze Layer is materialized
+        archive_path.unlink(missing_ok=True)
+
+        self._save_cache_info(url)
+        print("✅ Ingestion cycle completed successfully")
+        return str(RAW_DATA_PATH)
+
     def _save_cache_info(self, cache_path: str | Path) -> None:
         """Persists ingestion metadata to a YAML manifest for traceability.
 
@@ -0,0 +1,98 @@
+import os
+import math
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Final
+
+# Transfer tuning: 8 concurrent range streams, 1 MiB socket reads.
+# Mirrors the part-based design of cloud transfer managers (e.g. S3).
+DEFAULT_PARTS: Final[int] = 8
+READ_CHUNK: Final[int] = 1 << 20
+REQUEST_TIMEOUT: Final[int] = 60
+
+
+def _fetch_range(url: str, dest_fd: int, lo: int, hi: int) -> None:
+    """Streams one byte range of the remote file into its slot.
+
+    Args:
+        url (str): Source URL supporting HTTP range requests.
+        dest_fd (int): File descriptor of the preallocated destination.
+        lo (int): First byte offset of the range (inclusive).
+        hi (int): Last byte offset of the range (inclusive).
+
+    Returns:
+        None
+    """
+    headers: dict[str, str] = {"Range": f"bytes={lo}-{hi}"}
+
+    with requests.get(url, headers=headers, stream=True, timeout=REQUEST_TIMEOUT) as response:
+        response.raise_for_status()
+        offset: int = lo
+        # pwrite is positional, so concurrent workers never contend on a seek
+        for chunk in response.iter_content(chunk_size=READ_CHUNK):
+            os.pwrite(dest_fd, chunk, offset)
+            offset += len(chunk)
+
+
+def _single_stream_download(url: str, dest: Path) -> None:
+    """Fallback transfer for servers without range support."""
+    with requests.get(url, stream=True, timeout=REQUEST_TIMEOUT) as response:
+        response.raise_for_status()
+        with open(dest, "wb") as f:
+            for chunk in response.iter_content(chunk_size=READ_CHUNK):
+                f.write(chunk)
+
+
+def range_download(url: str, dest: str | Path, parts: int = DEFAULT_PARTS) -> Path:
+    """Downloads a remote file using parallel HTTP range requests.
+
+    Splits the transfer into byte ranges fetched by a thread pool, each
+    writing positionally into a preallocated file. Saturates high-bandwidth
+    links that a single TCP stream cannot, degrading gracefully to a single
+    stream when the server does not advertise range support.
+
+    Args:
+        url (str): Source URL of the artifact.
+        dest (str | Path): Local destination path.
+        parts (int): Number of concurrent range streams. Defaults to 8.
+
+    Returns:
+        Path: The resolved destination path.
+
+    Raises:
+        requests.HTTPError: If the server rejects the transfer.
+    """
+    dest = Path(dest)
+    dest.parent.mkdir(parents=True, exist_ok=True)
+
+    # Probe size and range capability before committing to parallelism
+    head = requests.head(url, allow_redirects=True, timeout=REQUEST_TIMEOUT)
+    size: int = int(head.headers.get("Content-Length", 0))
+    supports_ranges: bool = head.headers.get("Accept-Ranges", "").lower() == "bytes"
+
+    if not size or not supports_ranges or parts <= 1:
+        print("📥 Server lacks range support — falling back to single stream")
+        _single_stream_download(url, dest)
+        return dest
+
+    print(f"📥 Parallel download: {parts} range streams for {size >> 20} MiB")
+
+    fd: int = os.open(dest, os.O_CREAT | os.O_WRONLY | os.O_TRUNC)
+    try:
+        # Preallocate so positional writes never race on file extension
+        if hasattr(os, "posix_fallocate"):
+            os.posix_fallocate(fd, 0, size)
+
+        step: int = math.ceil(size / parts)
+        ranges: list[tuple[int, int]] = [
+            (lo, min(lo + step, size) - 1) for lo in range(0, size, step)
+        ]
+
+        with ThreadPoolExecutor(max_workers=parts) as executor:
+            # list() drains the iterator so worker exceptions propagate here
+            list(executor.map(lambda r: _fetch_range(url, fd, *r), ranges))
+    finally:
+        os.close(fd)
+
+    return dest
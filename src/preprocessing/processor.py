@@ -1,22 +1,133 @@
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 import pyarrow.csv as pv
+import pyarrow.dataset as pa_dataset
 import pyarrow.parquet as pq
-import gc
 import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import Final
-from src.training.loader import DataLoader
+from src.training.loader import DataLoader, MASTER_PARTITIONING
+from src.utils.cache import is_stage_fresh, mark_stage_fresh
 from src.config import (
     RAW_DATA_PATH,
     RAW_PARQUET_DIR,
     OPTIMIZED_DTYPES,
     RAW_CSV_FILES,
-    MERGED_FILE_PATH,
+    MERGED_DATASET_DIR,
     FAULTY_TRAIN_FILENAME,
     NORMAL_TRAIN_FILENAME,
     CROPPED_DATA_PATH
 )
 
+# Optional accelerator: Polars fuses scan->sink plans and streams end-to-end.
+# The pipeline transparently falls back to the PyArrow path when absent.
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+# Streaming parameters: one 64MB block bounds peak memory during CSV ingestion
+CSV_BLOCK_SIZE: Final[int] = 64 << 20
+
+# Merge streaming: rows per batch, which also sets the merged row-group size
+MERGE_BATCH_ROWS: Final[int] = 200_000
+
+
+def _arrow_schema_from(dtypes: dict[str, str]) -> dict[str, pa.DataType]:
+    """Translates the pandas-style dtype map into PyArrow column types.
+
+    Args:
+        dtypes (dict[str, str]): Column-to-dtype mapping (e.g. 'float32').
+
+    Returns:
+        dict[str, pa.DataType]: Column-to-Arrow-type mapping for ConvertOptions.
+    """
+    return {col: pa.type_for_alias(dtype) for col, dtype in dtypes.items()}
+
+
+def _polars_schema_from(dtypes: dict[str, str]) -> "dict[str, pl.DataType]":
+    """Translates the pandas-style dtype map into Polars column types.
+
+    Args:
+        dtypes (dict[str, str]): Column-to-dtype mapping (e.g. 'float32').
+
+    Returns:
+        dict[str, pl.DataType]: Column-to-Polars-type mapping for scan_csv.
+    """
+    aliases: dict[str, str] = {"int8": "Int8", "int16": "Int16", "float32": "Float32"}
+    return {col: getattr(pl, aliases[dtype]) for col, dtype in dtypes.items()}
+
+
+def _convert_one(csv_name: str, force: bool = False) -> None:
+    """Streams a single CSV artifact into its Parquet counterpart.
+
+    Module-level (picklable) so conversions can be dispatched to worker
+    processes, one per raw file.
+
+    Args:
+        csv_name (str): Raw CSV filename inside RAW_DATA_PATH.
+        force (bool): If True, overwrite an existing Parquet artifact.
+
+    Returns:
+        None
+    """
+    csv_path = RAW_DATA_PATH / csv_name
+    parquet_path = RAW_PARQUET_DIR / csv_name.replace(".csv", ".parquet")
+
+    # Content-hash gate: re-run when the upstream CSV or dtype schema changed,
+    # not merely when the output file is missing
+    if not force and is_stage_fresh(parquet_path, [csv_path], repr(OPTIMIZED_DTYPES)):
+        print(f"⏩ Skipping: {parquet_path.name}")
+        return
+
+    if pl is not None:
+        print(f"🚀 High-Speed Converting (Polars Streaming): {csv_name}...")
+
+        # Restrict overrides to the columns actually present in this file
+        header: list[str] = csv_path.open().readline().rstrip("\n").split(",")
+        overrides = {
+            col: dtype for col, dtype in _polars_schema_from(OPTIMIZED_DTYPES).items()
+            if col in header
+        }
+
+        # Lazy scan->sink fuses the plan: projection/predicate pushdown at the
+        # reader, no intermediate materialization, constant memory
+        (
+            pl.scan_csv(csv_path, schema_overrides=overrides)
+            .sink_parquet(
+                parquet_path,
+                compression="zstd", compression_level=3,
+                row_group_size=MERGE_BATCH_ROWS
+            )
+        )
+
+        mark_stage_fresh(parquet_path, [csv_path], repr(OPTIMIZED_DTYPES))
+        print(f"✅ Optimized: {parquet_path.name}")
+        return
+
+    print(f"🚀 High-Speed Converting (PyArrow Streaming): {csv_name}...")
+
+    # PyArrow parses in C++ with all cores, without the Pandas block manager
+    reader = pv.open_csv(
+        csv_path,
+        read_options=pv.ReadOptions(block_size=CSV_BLOCK_SIZE, use_threads=True),
+        convert_options=pv.ConvertOptions(column_types=_arrow_schema_from(OPTIMIZED_DTYPES))
+    )
+
+    # Incremental write: each parsed block lands on disk immediately
+    with pq.ParquetWriter(
+        parquet_path, reader.schema,
+        compression="zstd", compression_level=3
+    ) as writer:
+        for batch in reader:
+            writer.write_batch(batch)
+
+    mark_stage_fresh(parquet_path, [csv_path], repr(OPTIMIZED_DTYPES))
+    print(f"✅ Optimized: {parquet_path.name}")
+
 class DataProcessor:
     """Orchestrates data transformation and consolidation within the Silver Layer.
 
@@ -55,67 +166,90 @@ class DataProcessor:
     def convert_csv_to_parquet(self) -> None:
         """
         Transmutes raw CSV artifacts into Parquet using PyArrow Engine.
-        Direct PyArrow reading is much more memory-efficient than Pandas for large CSVs.
+        Each file is independent, so conversions are dispatched to a pool of
+        worker processes and run concurrently, bounded by the largest file.
         """
 
         RAW_PARQUET_DIR.mkdir(parents=True, exist_ok=True)
 
-        for csv_name in RAW_CSV_FILES:
-            csv_path = RAW_DATA_PATH / csv_name
-            parquet_path = RAW_PARQUET_DIR / csv_name.replace(".csv", ".parquet")
-
-            if parquet_path.exists() and not self.force_mode:
-                print(f"⏩ Skipping: {parquet_path.name}")
-                continue
-
-            print(f"🚀 High-Speed Converting (PyArrow): {csv_name}...")
-
-            # PyArrow lit le fichier en C++ sans l'overhead de Python/Pandas
-            # Il respecte automatiquement les types si possible ou les gère mieux
-            table = pv.read_csv(csv_path)
-
-            # Ecriture immédiate sur le disque
-            pq.write_table(table, parquet_path)
-
-            print(f"✅ Optimized: {parquet_path.name}")
-
-            # Nettoyage
-            del table
-            gc.collect()
+        max_workers: int = min(len(RAW_CSV_FILES), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            # list() drains the iterator so worker exceptions propagate here
+            list(executor.map(partial(_convert_one, force=self.force_mode), RAW_CSV_FILES))
 
         print("✅ Silver Layer is fully synchronized.")
 
-    def merge_faulty_and_normal_data(self) -> pd.DataFrame:
+    def merge_faulty_and_normal_data(self) -> pa.Table | None:
         """Consolidates discrete training sets into a unified Master Silver record.
 
-        Handles class labeling for baseline data and ensures vertical concatenation
-        integrity before persisting the Gold Master record.
-        """
-        if MERGED_FILE_PATH.exists() and not self.force_mode:
-            print(f"✅ Master record detected: {MERGED_FILE_PATH.name}")
-            return pd.read_parquet(MERGED_FILE_PATH)
+        Reads record batches from both source Parquet files, injecting class 0
+        batch-by-batch for baseline data, and lands the result as a hive
+        dataset partitioned by faultNumber. Per-class readers (run quotas,
+        faulty-only training) then prune at the directory level.
 
+        Returns:
+            pa.Table | None: The freshly merged record as a zero-copy chunked
+                Arrow table, so the training phase can skip re-reading the
+                dataset it just wrote. None when the cached record is still
+                fresh (callers then read from disk) or sources are empty.
+        """
         faulty_path: Final[Path] = RAW_PARQUET_DIR / FAULTY_TRAIN_FILENAME
         normal_path: Final[Path] = RAW_PARQUET_DIR / NORMAL_TRAIN_FILENAME
 
-        print(f"📖 Merging artifacts: {faulty_path.name} + {normal_path.name}")
-        faulty_df: pd.DataFrame = pd.read_parquet(faulty_path)
-        normal_df: pd.DataFrame = pd.read_parquet(normal_path)
-
-        if normal_df.empty and faulty_df.empty:
-            print("❌ Critical: Source dataframes are empty.")
-            return pd.DataFrame()
-
-        # Harmonization: Assigning class 0 to normal operation data
-        if "faultNumber" not in normal_df.columns:
-            normal_df["faultNumber"] = 0
+        # Content-hash gate: invalidates the master record when either source
+        # parquet or the dtype schema changed since the last merge
+        if not self.force_mode and is_stage_fresh(
+            MERGED_DATASET_DIR, [faulty_path, normal_path], repr(OPTIMIZED_DTYPES)
+        ):
+            print(f"✅ Master record detected: {MERGED_DATASET_DIR.name}")
+            return None
 
-        # Master dataset generation (Silver Level)
-        merged_df: pd.DataFrame = pd.concat([normal_df, faulty_df], axis=0, ignore_index=True)
-        merged_df.to_parquet(MERGED_FILE_PATH, engine="pyarrow", index=False)
-
-        print(f"✅ Consolidated record saved: {MERGED_FILE_PATH.name}")
-        return merged_df
+        print(f"📖 Merging artifacts: {faulty_path.name} + {normal_path.name}")
+        pf_faulty: pq.ParquetFile = pq.ParquetFile(faulty_path)
+        pf_normal: pq.ParquetFile = pq.ParquetFile(normal_path)
+
+        if pf_faulty.metadata.num_rows == 0 and pf_normal.metadata.num_rows == 0:
+            print("❌ Critical: Source artifacts are empty.")
+            return None
+
+        # The faulty schema carries the enforced narrow types and the full
+        # column set, making it the contract for the merged record
+        target_schema: pa.Schema = pf_faulty.schema_arrow
+
+        # Collect batches: pa.Table.from_batches is zero-copy, giving the
+        # caller the merged table without a read-back from disk
+        merged_batches: list[pa.RecordBatch] = []
+
+        for batch in pf_normal.iter_batches(batch_size=MERGE_BATCH_ROWS):
+            # Harmonization: Assigning class 0 to normal operation data
+            if "faultNumber" not in batch.schema.names:
+                batch = batch.append_column(
+                    "faultNumber", pa.array(np.zeros(len(batch), dtype=np.int8))
+                )
+            merged_batches.append(batch.select(target_schema.names).cast(target_schema))
+
+        for batch in pf_faulty.iter_batches(batch_size=MERGE_BATCH_ROWS):
+            merged_batches.append(batch.cast(target_schema))
+
+        merged_table: pa.Table = pa.Table.from_batches(merged_batches, schema=target_schema)
+
+        # Hive layout: one faultNumber=<k>/ directory per class, enabling
+        # directory-level pruning for per-class readers downstream
+        pa_dataset.write_dataset(
+            merged_table,
+            base_dir=MERGED_DATASET_DIR,
+            format="parquet",
+            partitioning=MASTER_PARTITIONING,
+            existing_data_behavior="delete_matching",
+            max_rows_per_group=MERGE_BATCH_ROWS,
+            file_options=pa_dataset.ParquetFileFormat().make_write_options(
+                compression="zstd", compression_level=3, use_dictionary=True
+            )
+        )
+
+        mark_stage_fresh(MERGED_DATASET_DIR, [faulty_path, normal_path], repr(OPTIMIZED_DTYPES))
+        print(f"✅ Consolidated record saved: {MERGED_DATASET_DIR.name}")
+        return merged_table
 
     def process_silver_layer(self) -> None:
         """Orchestrates the cropping and reindexing workflow for testing data.
@@ -145,7 +279,10 @@ class DataProcessor:
                 df = pd.read_csv(RAW_DATA_PATH / file_name, dtype=OPTIMIZED_DTYPES)
 
             df_final: pd.DataFrame = self.crop_and_reindex_samples(df)
-            df_final.to_parquet(output_path, engine="pyarrow", index=False)
+            df_final.to_parquet(
+                output_path, engine="pyarrow", index=False,
+                compression="zstd", compression_level=3
+            )
             print(f"✅ Ready for Dashboard: {parquet_name}")
             processed_count += 1
 
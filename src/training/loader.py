@@ -1,17 +1,82 @@
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.dataset as pa_dataset
 from pathlib import Path
 from sklearn.utils import shuffle
+from src.utils.cache import is_stage_fresh, mark_stage_fresh
 from src.config import (
     RAW_PARQUET_DIR,
     SUBSETS_DIR,
     FINAL_SPLIT_DIR,
-    MERGED_FILE_PATH,
+    MERGED_DATASET_DIR,
     DEFAULT_N_SIMULATIONS,
     DEFAULT_TEST_SIZE,
+    FEATURE_COLUMNS,
     RANDOM_SEED
 )
 
+# Non-feature columns pruned when decoupling X from y
+METADATA_COLUMNS: list[str] = ['faultNumber', 'simulationRun', 'sample', 'unique_run_id']
+
+# Hive layout of the master record (faultNumber=<k>/ directories). Declaring
+# the partition schema keeps faultNumber an int8 on both write and read.
+MASTER_PARTITIONING = pa_dataset.partitioning(
+    pa.schema([("faultNumber", pa.int8())]), flavor="hive"
+)
+
+
+def open_master_dataset() -> pa_dataset.Dataset:
+    """Opens the partitioned master record with its declared partition schema.
+
+    Returns:
+        pa_dataset.Dataset: Scannable handle over the merged TEP record.
+    """
+    return pa_dataset.dataset(
+        MERGED_DATASET_DIR, format="parquet", partitioning=MASTER_PARTITIONING
+    )
+
+
+def _allowed_pairs(keys: pd.DataFrame, n_simulations: int) -> pd.DataFrame:
+    """Selects the first n simulation runs of each fault class.
+
+    Fully vectorized — no Python lambda per group, no per-group np.unique.
+
+    Args:
+        keys (pd.DataFrame): Frame with 'faultNumber' and 'simulationRun' columns.
+        n_simulations (int): Number of unique runs to keep per faultNumber.
+
+    Returns:
+        pd.DataFrame: The allowed (faultNumber, simulationRun) pairs.
+    """
+    return (
+        keys
+        .drop_duplicates()
+        .sort_values(['faultNumber', 'simulationRun'])
+        .groupby('faultNumber', sort=False)
+        .head(n_simulations)
+    )
+
+
+def _compute_run_id(df: pd.DataFrame) -> np.ndarray:
+    """Builds the composite integer run key for group-wise splitting.
+
+    int64 arithmetic avoids per-row string allocation and keeps later
+    .unique()/.isin() calls on pandas' fast int64 hashtable. The 100_000
+    multiplier is collision-free for TEP (simulation runs go up to 500).
+
+    Args:
+        df (pd.DataFrame): Frame containing 'faultNumber' and 'simulationRun'.
+
+    Returns:
+        np.ndarray: int64 key uniquely identifying each (fault, run) pair.
+    """
+    return (
+        df['faultNumber'].to_numpy(np.int64) * np.int64(100_000)
+        + df['simulationRun'].to_numpy(np.int64)
+    )
+
+
 class DataLoader:
     """Orchestrates data ingestion, subsampling, and leakage-proof splitting strategies.
 
@@ -30,12 +95,18 @@ class DataLoader:
         # Logical path resolution for the data source
         self.data_path: Path = Path(data_path) if data_path else RAW_PARQUET_DIR
 
-    def load_data(self, n_simulations: int = DEFAULT_N_SIMULATIONS) -> pd.DataFrame:
+    def load_data(
+        self,
+        n_simulations: int = DEFAULT_N_SIMULATIONS,
+        prebuilt: "pa.Table | None" = None
+    ) -> pd.DataFrame:
         """Loads data from cache or generates a new subset from the master record.
 
         Args:
             n_simulations (int | None): Quota of simulation runs to retain per fault.
                 If None, the full dataset is loaded.
+            prebuilt (pa.Table | None): In-memory merged record handed over by
+                the preprocessing phase, skipping the Parquet read-back.
 
         Returns:
             pd.DataFrame: Processed dataset with a 'unique_run_id' for unit-testing tracking.
@@ -45,22 +116,50 @@ class DataLoader:
         """
         subset_path: Path = SUBSETS_DIR / f"TEP_subset_N{n_simulations}.parquet"
 
-        if subset_path.exists():
+        # Projection pushdown: the columnar layout lets Parquet skip the
+        # 'sample' index and any unused columns at read time
+        needed_columns: list[str] = FEATURE_COLUMNS + ['faultNumber', 'simulationRun']
+
+        # Content-hash gate: reuse the cached subset only while the master
+        # record it was carved from is unchanged
+        if is_stage_fresh(subset_path, [MERGED_DATASET_DIR], str(n_simulations)):
             print(f"⚡ Ingesting cached subset: {subset_path.name}")
-            df: pd.DataFrame = pd.read_parquet(subset_path)
+            # The subset already carries its precomputed unique_run_id column
+            df: pd.DataFrame = pd.read_parquet(
+                subset_path, columns=needed_columns + ['unique_run_id']
+            )
+        elif prebuilt is not None:
+            print("⚡ Ingesting in-memory master record (no Parquet round-trip)")
+            # self_destruct releases Arrow buffers as they convert, avoiding
+            # a simultaneous Arrow + pandas allocation of the full table
+            df: pd.DataFrame = prebuilt.select(needed_columns).to_pandas(
+                split_blocks=True, self_destruct=True
+            )
+            if n_simulations:
+                df = self._subsample_by_run(df, n_simulations)
+                df.to_parquet(subset_path, index=False, compression="zstd", compression_level=3)
+                mark_stage_fresh(subset_path, [MERGED_DATASET_DIR], str(n_simulations))
         else:
             print("📖 Generating fresh subset from Gold Master record...")
-            if not MERGED_FILE_PATH.exists():
-                raise FileNotFoundError(f"❌ Master artifact missing at: {MERGED_FILE_PATH}")
+            if not MERGED_DATASET_DIR.exists():
+                raise FileNotFoundError(f"❌ Master artifact missing at: {MERGED_DATASET_DIR}")
 
-            df: pd.DataFrame = pd.read_parquet(MERGED_FILE_PATH)
             if n_simulations:
-                df = self._subsample_by_run(df, n_simulations)
+                # Predicate pushdown: only matching row groups leave the disk,
+                # so the full master record is never materialized
+                df: pd.DataFrame = self._scan_subset(n_simulations, needed_columns)
                 # Persist the subset to minimize expensive I/O in future iterations
-                df.to_parquet(subset_path, index=False)
+                df.to_parquet(subset_path, index=False, compression="zstd", compression_level=3)
+                mark_stage_fresh(subset_path, [MERGED_DATASET_DIR], str(n_simulations))
+            else:
+                df: pd.DataFrame = open_master_dataset().to_table(
+                    columns=needed_columns
+                ).to_pandas(split_blocks=True, self_destruct=True)
 
-        # Generate a composite key to ensure grouping integrity during train/test split
-        df['unique_run_id'] = df['faultNumber'].astype(str) + "_" + df['simulationRun'].astype(str)
+        # Key already present when the subset cache (or _subsample_by_run)
+        # supplied it — only the full master path still needs the computation
+        if 'unique_run_id' not in df.columns:
+            df['unique_run_id'] = _compute_run_id(df)
         return df
 
     def split_by_run(
@@ -85,43 +184,88 @@ class DataLoader:
 
         train_runs: np.ndarray = unique_runs[:split_idx]
 
-        # Sectorization into training and evaluation sets
-        df_train: pd.DataFrame = df[df['unique_run_id'].isin(train_runs)].copy()
-        df_test: pd.DataFrame = df[~df['unique_run_id'].isin(train_runs)].copy()
+        # Sectorization into training and evaluation sets.
+        # One hashtable probe over the frame; the test mask is its negation.
+        # Projecting features and target directly from the masked rows avoids
+        # the old copy -> drop-columns -> copy chain (one materialization per
+        # output instead of three full-width clones).
+        mask: pd.Series = df['unique_run_id'].isin(train_runs)
+        feature_cols: list[str] = [c for c in df.columns if c not in METADATA_COLUMNS]
+
+        X_train: pd.DataFrame = df.loc[mask, feature_cols].reset_index(drop=True)
+        y_train: pd.Series = df.loc[mask, 'faultNumber'].reset_index(drop=True)
+        X_test: pd.DataFrame = df.loc[~mask, feature_cols].reset_index(drop=True)
+        y_test: pd.Series = df.loc[~mask, 'faultNumber'].reset_index(drop=True)
 
-        return self._finalize_split(df_train), self._finalize_split(df_test)
+        return (X_train, y_train), (X_test, y_test)
 
-    def _finalize_split(self, df: pd.DataFrame) -> tuple[pd.DataFrame, pd.Series]:
-        """De-couples features from labels and prunes metadata.
+    def _subsample_by_run(self, df: pd.DataFrame, n_simulations: int) -> pd.DataFrame:
+        """Filters the dataset to preserve a fixed quota of simulations per fault class.
 
         Args:
-            df (pd.DataFrame): Raw split segment.
+            df (pd.DataFrame): The full master dataset.
+            n_simulations (int): Number of unique runs to keep per faultNumber.
 
         Returns:
-            tuple[pd.DataFrame, pd.Series]: A tuple of (Features, Target).
+            pd.DataFrame: A downsampled dataframe.
         """
-        metadata: list[str] = ['faultNumber', 'simulationRun', 'sample', 'unique_run_id']
-        cols_to_drop: list[str] = [c for c in metadata if c in df.columns]
+        print(f"📉 Downsampling to {n_simulations} simulations per fault class...")
 
-        X: pd.DataFrame = df.drop(columns=cols_to_drop)
-        y: pd.Series = df['faultNumber']
-        return X, y
+        allowed: pd.DataFrame = _allowed_pairs(df[['faultNumber', 'simulationRun']], n_simulations)
 
-    def _subsample_by_run(self, df: pd.DataFrame, n_simulations: int) -> pd.DataFrame:
-        """Filters the dataset to preserve a fixed quota of simulations per fault class.
+        # Membership test on a composite index hits pandas' C hashtable path
+        idx: pd.MultiIndex = pd.MultiIndex.from_frame(df[['faultNumber', 'simulationRun']])
+        allowed_idx: pd.MultiIndex = pd.MultiIndex.from_frame(allowed)
+        mask: np.ndarray = idx.isin(allowed_idx)
+        subset: pd.DataFrame = df[mask].reset_index(drop=True)
+
+        # Bake the run key into the subset so cached reads skip the recompute
+        subset['unique_run_id'] = _compute_run_id(subset)
+        return subset
+
+    def _scan_subset(self, n_simulations: int, needed_columns: list[str]) -> pd.DataFrame:
+        """Carves the per-fault run quota out of the master record via pushdown.
+
+        Resolves the allowed (faultNumber, simulationRun) pairs from a cheap
+        two-column scan, then reads the master as a pyarrow dataset with an
+        isin filter so only matching row groups are decoded. The coarse filter
+        is a superset (cross product of allowed values), so the exact pair
+        mask is re-applied on the reduced frame.
 
         Args:
-            df (pd.DataFrame): The full master dataset.
             n_simulations (int): Number of unique runs to keep per faultNumber.
+            needed_columns (list[str]): Columns to project from the record.
 
         Returns:
-            pd.DataFrame: A downsampled dataframe.
+            pd.DataFrame: The downsampled dataframe with its run key baked in.
         """
-        print(f"📉 Downsampling to {n_simulations} simulations per fault class...")
-        mask: pd.Series = df.groupby('faultNumber')['simulationRun'].transform(
-            lambda x: x.isin(np.unique(x)[:n_simulations])
+        print(f"📉 Scanning {n_simulations} simulations per fault class (pushdown)...")
+
+        dataset: pa_dataset.Dataset = open_master_dataset()
+
+        # Pass 1: key columns only — a tiny fraction of the dataset
+        keys: pd.DataFrame = dataset.to_table(
+            columns=['faultNumber', 'simulationRun']
+        ).to_pandas()
+        allowed: pd.DataFrame = _allowed_pairs(keys, n_simulations)
+
+        # Pass 2: the coarse predicate prunes whole faultNumber partitions at
+        # the directory level and non-matching row groups within them
+        coarse_filter = (
+            pa_dataset.field('faultNumber').isin(allowed['faultNumber'].unique())
+            & pa_dataset.field('simulationRun').isin(allowed['simulationRun'].unique())
         )
-        return df[mask].reset_index(drop=True)
+        df: pd.DataFrame = dataset.to_table(
+            columns=needed_columns, filter=coarse_filter
+        ).to_pandas(split_blocks=True, self_destruct=True)
+
+        # Exact refinement on the already-reduced frame
+        idx: pd.MultiIndex = pd.MultiIndex.from_frame(df[['faultNumber', 'simulationRun']])
+        allowed_idx: pd.MultiIndex = pd.MultiIndex.from_frame(allowed)
+        subset: pd.DataFrame = df[idx.isin(allowed_idx)].reset_index(drop=True)
+
+        subset['unique_run_id'] = _compute_run_id(subset)
+        return subset
 
     def save_test_set(self, X_test: pd.DataFrame, y_test: pd.Series) -> None:
         """Serializes the final test set to the Gold Layer for model evaluation.
@@ -136,5 +280,5 @@ class DataLoader:
         df_test['target'] = y_test.values
 
         # Final archival of the Gold Standard test set
-        df_test.to_parquet(output_path, index=False)
+        df_test.to_parquet(output_path, index=False, compression="zstd", compression_level=3)
         print(f"✅ Gold Standard test set archived: {output_path}")
@@ -0,0 +1,78 @@
+import hashlib
+from pathlib import Path
+
+# Streaming granularity for hashing large raw artifacts (1 MiB)
+_HASH_CHUNK_SIZE: int = 1 << 20
+
+
+def stage_hash(input_paths: list[Path], extra_config: str = "") -> str:
+    """Computes a content hash identifying a pipeline stage's inputs.
+
+    Streams every input file through SHA-256 and mixes in a configuration
+    string, so the resulting key changes whenever upstream data *or* the
+    stage's parameters change — unlike a bare 'output exists' check.
+
+    Args:
+        input_paths (list[Path]): Upstream artifacts consumed by the stage.
+        extra_config (str): Stage configuration to mix into the key
+            (e.g. repr of a dtype map or hyperparameter dict).
+
+    Returns:
+        str: Hex digest uniquely identifying the stage inputs.
+    """
+    digest = hashlib.sha256()
+    digest.update(extra_config.encode())
+
+    for path in sorted(Path(p) for p in input_paths):
+        # Directory inputs (e.g. partitioned datasets) hash every file inside
+        files = sorted(p for p in path.rglob("*") if p.is_file()) if path.is_dir() else [path]
+        for file in files:
+            digest.update(str(file.name).encode())
+            with open(file, "rb") as f:
+                while chunk := f.read(_HASH_CHUNK_SIZE):
+                    digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def _sentinel_path(artifact: Path) -> Path:
+    """Resolves the sidecar file storing an artifact's input hash."""
+    return artifact.with_name(artifact.name + ".hash")
+
+
+def is_stage_fresh(artifact: Path, input_paths: list[Path], extra_config: str = "") -> bool:
+    """Checks whether a stage output is up to date with its inputs.
+
+    Args:
+        artifact (Path): The stage's output artifact.
+        input_paths (list[Path]): Upstream artifacts consumed by the stage.
+        extra_config (str): Stage configuration mixed into the key.
+
+    Returns:
+        bool: True if the artifact exists and its recorded input hash matches.
+    """
+    if not artifact.exists():
+        return False
+
+    sentinel: Path = _sentinel_path(artifact)
+    if not sentinel.exists():
+        return False
+
+    if any(not Path(p).exists() for p in input_paths):
+        return False
+
+    return sentinel.read_text().strip() == stage_hash(input_paths, extra_config)
+
+
+def mark_stage_fresh(artifact: Path, input_paths: list[Path], extra_config: str = "") -> None:
+    """Records the input hash for a freshly produced stage artifact.
+
+    Args:
+        artifact (Path): The stage's output artifact (must exist).
+        input_paths (list[Path]): Upstream artifacts consumed by the stage.
+        extra_config (str): Stage configuration mixed into the key.
+
+    Returns:
+        None
+    """
+    _sentinel_path(artifact).write_text(stage_hash(input_paths, extra_config))
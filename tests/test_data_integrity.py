@@ -1,6 +1,6 @@
 import pandas as pd
 import sys
-from src.config import MERGED_FILE_PATH
+from src.config import MERGED_DATASET_DIR
 
 def check_merged_data() -> None:
     """Performs a structural integrity audit on the merged TEP dataset.
@@ -13,15 +13,15 @@ def check_merged_data() -> None:
         None: The function logs results to stdout and handles exits via sys.exit.
     """
     # Verify artifact existence before loading
-    if not MERGED_FILE_PATH.exists():
-        print(f"❌ Critical Failure: Artifact not found at {MERGED_FILE_PATH}")
+    if not MERGED_DATASET_DIR.exists():
+        print(f"❌ Critical Failure: Artifact not found at {MERGED_DATASET_DIR}")
         sys.exit(1)
 
     # Load optimized parquet artifact
-    df: pd.DataFrame = pd.read_parquet(MERGED_FILE_PATH)
+    df: pd.DataFrame = pd.read_parquet(MERGED_DATASET_DIR)
 
     print("=== Data Integrity Check ===")
-    print(f"📍 Path: {MERGED_FILE_PATH}")
+    print(f"📍 Path: {MERGED_DATASET_DIR}")
     print(f"📊 Dimensions: {df.shape[0]} rows, {df.shape[1]} columns")
 
     # Analyze class distribution for target leakage or imbalance